@@ -217,15 +217,54 @@ class TechnicalIndicators:
         slow_sc = 2 / (slow + 1)
         sc = (er * (fast_sc - slow_sc) + slow_sc) ** 2
 
-        kama = pd.Series(index=close.index, dtype=float)
-        kama.iloc[period - 1] = close.iloc[period - 1]
+        # Run the recurrence on plain float arrays instead of per-element iloc
+        close_arr = close.to_numpy(dtype=np.float64)
+        sc_arr = sc.to_numpy(dtype=np.float64)
+        kama = np.full(len(close_arr), np.nan)
+        if len(close_arr) >= period:
+            kama[period - 1] = close_arr[period - 1]
 
-        for i in range(period, len(close)):
-            kama.iloc[i] = kama.iloc[i - 1] + sc.iloc[i] * (
-                close.iloc[i] - kama.iloc[i - 1]
-            )
+        for i in range(period, len(close_arr)):
+            kama[i] = kama[i - 1] + sc_arr[i] * (close_arr[i] - kama[i - 1])
 
-        return kama
+        return pd.Series(kama, index=close.index)
+
+    @staticmethod
+    def calculate_atr(
+        high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14
+    ) -> pd.Series:
+        """Calculate Average True Range with Wilder smoothing.
+
+        True range is computed on raw NumPy arrays rather than via pandas
+        shift/concat, which keeps it cheap enough for per-call use in strategies.
+
+        Args:
+            high: High prices
+            low: Low prices
+            close: Close prices
+            period: ATR period
+
+        Returns:
+            ATR series
+        """
+        high_arr = high.to_numpy(dtype=np.float64)
+        low_arr = low.to_numpy(dtype=np.float64)
+        close_arr = close.to_numpy(dtype=np.float64)
+
+        prev_close = np.roll(close_arr, 1)
+        if len(prev_close) > 0:
+            prev_close[0] = close_arr[0]
+
+        tr = np.maximum(
+            high_arr - low_arr,
+            np.maximum(np.abs(high_arr - prev_close), np.abs(low_arr - prev_close)),
+        )
+
+        return (
+            pd.Series(tr, index=close.index)
+            .ewm(alpha=1 / period, adjust=False, min_periods=period)
+            .mean()
+        )
 
     @staticmethod
     def calculate_atr_percent(
@@ -1,6 +1,6 @@
 """ICT (Inner Circle Trader) pattern detection."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import pandas as pd
@@ -61,9 +61,38 @@ class StructurePoint:
     broken: bool = False
 
 
+class OHLCVArrays(NamedTuple):
+    """Price columns as contiguous float64 arrays (None if absent)."""
+
+    open: Optional[np.ndarray]
+    high: Optional[np.ndarray]
+    low: Optional[np.ndarray]
+    close: Optional[np.ndarray]
+    volume: Optional[np.ndarray]
+
+
 class ICTPatterns:
     """Detect ICT trading patterns and market structure."""
 
+    @staticmethod
+    def _as_arrays(df: pd.DataFrame) -> OHLCVArrays:
+        """Extract OHLCV columns once for the vectorized detectors.
+
+        Args:
+            df: DataFrame with OHLCV data
+
+        Returns:
+            Column arrays; float64 columns are returned without copying
+        """
+        return OHLCVArrays(
+            *(
+                np.ascontiguousarray(df[col].to_numpy(dtype=np.float64))
+                if col in df.columns
+                else None
+                for col in OHLCVArrays._fields
+            )
+        )
+
     @staticmethod
     def _validate_dataframe(df: pd.DataFrame, required_cols: List[str], min_rows: int = 3) -> bool:
         """Validate DataFrame for pattern detection.
@@ -118,50 +147,43 @@ class ICTPatterns:
         tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
         atr = tr.rolling(window=14).mean()
 
-        fvgs = []
+        arrays = ICTPatterns._as_arrays(df)
+        high, low = arrays.high, arrays.low
+        atr_values = atr.to_numpy()[2:]
+        atr_valid = ~np.isnan(atr_values) & (atr_values != 0)
+        threshold = min_gap_atr_multiple * atr_values
 
-        for i in range(2, len(df)):
-            atr_val = atr.iloc[i]
-            if pd.isna(atr_val) or atr_val == 0:
-                continue
+        # Bullish FVG: gap between candle i-2 high and candle i low
+        bull_size = low[2:] - high[:-2]
+        bullish = atr_valid & (bull_size > 0) & (bull_size >= threshold)
 
-            # Bullish FVG: gap between candle i-2 high and candle i low
-            gap_low_bull = df.iloc[i - 2]["high"]
-            gap_high_bull = df.iloc[i]["low"]
-
-            if gap_low_bull < gap_high_bull:  # Bullish gap exists
-                gap_size = gap_high_bull - gap_low_bull
-                if gap_size >= min_gap_atr_multiple * atr_val:
-                    fvgs.append(
-                        FairValueGap(
-                            start_idx=i - 2,
-                            end_idx=i,
-                            gap_high=gap_high_bull,
-                            gap_low=gap_low_bull,
-                            gap_size=gap_size,
-                            direction="bullish",
-                            timestamp=df.iloc[i]["timestamp"],
-                        )
-                    )
+        # Bearish FVG: gap between candle i-2 low and candle i high
+        bear_size = low[:-2] - high[2:]
+        bearish = atr_valid & (bear_size > 0) & (bear_size >= threshold)
 
-            # Bearish FVG: gap between candle i-2 low and candle i high
-            gap_high_bear = df.iloc[i - 2]["low"]
-            gap_low_bear = df.iloc[i]["high"]
-
-            if gap_low_bear < gap_high_bear:  # Bearish gap exists
-                gap_size = gap_high_bear - gap_low_bear
-                if gap_size >= min_gap_atr_multiple * atr_val:
-                    fvgs.append(
-                        FairValueGap(
-                            start_idx=i - 2,
-                            end_idx=i,
-                            gap_high=gap_high_bear,
-                            gap_low=gap_low_bear,
-                            gap_size=gap_size,
-                            direction="bearish",
-                            timestamp=df.iloc[i]["timestamp"],
-                        )
-                    )
+        # Interleave by bar so a bullish gap precedes a bearish one at the same i
+        hits = np.flatnonzero(np.column_stack([bullish, bearish]))
+        end_indices = hits // 2 + 2
+        timestamps = df["timestamp"].iloc[end_indices].tolist()
+
+        fvgs = []
+        for hit, i, timestamp in zip(hits, end_indices.tolist(), timestamps):
+            if hit % 2 == 0:
+                gap_high, gap_low, direction = low[i], high[i - 2], "bullish"
+            else:
+                gap_high, gap_low, direction = low[i - 2], high[i], "bearish"
+
+            fvgs.append(
+                FairValueGap(
+                    start_idx=i - 2,
+                    end_idx=i,
+                    gap_high=gap_high,
+                    gap_low=gap_low,
+                    gap_size=gap_high - gap_low,
+                    direction=direction,
+                    timestamp=timestamp,
+                )
+            )
 
         logger.info(f"Detected {len(fvgs)} Fair Value Gaps")
         return fvgs
@@ -185,57 +207,35 @@ class ICTPatterns:
         if not ICTPatterns._validate_dataframe(df, ['high', 'low', 'open', 'close', 'timestamp'], min_rows=3):
             return []
 
-        order_blocks = []
-
-        for i in range(1, len(df) - 1):
-            current = df.iloc[i]
-            next_candle = df.iloc[i + 1]
-
-            # Bullish order block: bearish candle before bullish impulse
-            if current["close"] < current["open"]:  # Bearish candle
-                next_range = next_candle["high"] - next_candle["low"]
-                current_range = current["high"] - current["low"]
-
-                if (
-                    next_candle["close"] > next_candle["open"]
-                    and next_range > current_range * imbalance_ratio
-                ):
-                    strength = next_range / current_range
-                    order_blocks.append(
-                        OrderBlock(
-                            idx=i,
-                            high=current["high"],
-                            low=current["low"],
-                            open=current["open"],
-                            close=current["close"],
-                            direction="bullish",
-                            timestamp=current["timestamp"],
-                            strength=strength,
-                        )
-                    )
-
-            # Bearish order block: bullish candle before bearish impulse
-            if current["close"] > current["open"]:  # Bullish candle
-                next_range = next_candle["high"] - next_candle["low"]
-                current_range = current["high"] - current["low"]
-
-                if (
-                    next_candle["close"] < next_candle["open"]
-                    and next_range > current_range * imbalance_ratio
-                ):
-                    strength = next_range / current_range
-                    order_blocks.append(
-                        OrderBlock(
-                            idx=i,
-                            high=current["high"],
-                            low=current["low"],
-                            open=current["open"],
-                            close=current["close"],
-                            direction="bearish",
-                            timestamp=current["timestamp"],
-                            strength=strength,
-                        )
-                    )
+        arrays = ICTPatterns._as_arrays(df)
+        open_, high, low, close = arrays.open, arrays.high, arrays.low, arrays.close
+        candle_range = high - low
+        bearish_candle = close < open_
+        bullish_candle = close > open_
+
+        # Candle i against the impulse candle i+1
+        impulsive = candle_range[2:] > candle_range[1:-1] * imbalance_ratio
+        # Bullish order block: bearish candle before bullish impulse
+        bullish = bearish_candle[1:-1] & bullish_candle[2:] & impulsive
+        # Bearish order block: bullish candle before bearish impulse
+        bearish = bullish_candle[1:-1] & bearish_candle[2:] & impulsive
+
+        indices = np.flatnonzero(bullish | bearish) + 1
+        timestamps = df["timestamp"].iloc[indices].tolist()
+
+        order_blocks = [
+            OrderBlock(
+                idx=i,
+                high=high[i],
+                low=low[i],
+                open=open_[i],
+                close=close[i],
+                direction="bullish" if bearish_candle[i] else "bearish",
+                timestamp=timestamp,
+                strength=candle_range[i + 1] / candle_range[i],
+            )
+            for i, timestamp in zip(indices.tolist(), timestamps)
+        ]
 
         logger.info(f"Detected {len(order_blocks)} Order Blocks")
         return order_blocks
@@ -254,46 +254,44 @@ class ICTPatterns:
             List of structure points
         """
         # Validate input
+        if swing_lookback < 1:
+            logger.warning(f"swing_lookback must be >= 1, got {swing_lookback}")
+            return []
+
         min_rows = 2 * swing_lookback + 1
         if not ICTPatterns._validate_dataframe(df, ['high', 'low', 'timestamp'], min_rows=min_rows):
             return []
 
-        structure_points = []
-
-        for i in range(swing_lookback, len(df) - swing_lookback):
-            # Check for swing high
-            is_swing_high = all(
-                df.iloc[i]["high"] > df.iloc[i + j]["high"]
-                for j in range(-swing_lookback, swing_lookback + 1)
-                if j != 0
+        arrays = ICTPatterns._as_arrays(df)
+        high, low = arrays.high, arrays.low
+        n, k = len(df), swing_lookback
+
+        # A bar is a swing when it strictly beats the extreme of the k bars on
+        # either side; rolling(k) at i-1 and i+k covers those two flanks
+        rolling_max = pd.Series(high).rolling(k).max().to_numpy()
+        rolling_min = pd.Series(low).rolling(k).min().to_numpy()
+        center = slice(k, n - k)
+        is_swing_high = (high[center] > rolling_max[k - 1 : n - k - 1]) & (
+            high[center] > rolling_max[2 * k :]
+        )
+        is_swing_low = (low[center] < rolling_min[k - 1 : n - k - 1]) & (
+            low[center] < rolling_min[2 * k :]
+        )
+
+        # Interleave by bar so a swing high precedes a swing low at the same i
+        hits = np.flatnonzero(np.column_stack([is_swing_high, is_swing_low]))
+        indices = hits // 2 + k
+        timestamps = df["timestamp"].iloc[indices].tolist()
+
+        structure_points = [
+            StructurePoint(
+                idx=i,
+                price=high[i] if hit % 2 == 0 else low[i],
+                point_type="high" if hit % 2 == 0 else "low",
+                timestamp=timestamp,
             )
-
-            if is_swing_high:
-                structure_points.append(
-                    StructurePoint(
-                        idx=i,
-                        price=df.iloc[i]["high"],
-                        point_type="high",
-                        timestamp=df.iloc[i]["timestamp"],
-                    )
-                )
-
-            # Check for swing low
-            is_swing_low = all(
-                df.iloc[i]["low"] < df.iloc[i + j]["low"]
-                for j in range(-swing_lookback, swing_lookback + 1)
-                if j != 0
-            )
-
-            if is_swing_low:
-                structure_points.append(
-                    StructurePoint(
-                        idx=i,
-                        price=df.iloc[i]["low"],
-                        point_type="low",
-                        timestamp=df.iloc[i]["timestamp"],
-                    )
-                )
+            for hit, i, timestamp in zip(hits, indices.tolist(), timestamps)
+        ]
 
         logger.info(f"Detected {len(structure_points)} structure points")
         return structure_points
@@ -324,17 +322,20 @@ class ICTPatterns:
         tolerance = df["close"].std() * 0.01  # 1% of price std dev
 
         pools: Dict[float, List[StructurePoint]] = {}
+        levels = np.empty(len(structure_points), dtype=np.float64)
+        num_levels = 0
 
         for point in structure_points:
-            matched = False
-            for price_level in list(pools.keys()):
-                if abs(point.price - price_level) < tolerance:
-                    pools[price_level].append(point)
-                    matched = True
-                    break
+            # First existing level within tolerance, in insertion order
+            matches = np.flatnonzero(np.abs(levels[:num_levels] - point.price) < tolerance)
+            if len(matches) > 0:
+                pools[levels[matches[0]]].append(point)
+                continue
 
-            if not matched:
-                pools[point.price] = [point]
+            if point.price not in pools:
+                levels[num_levels] = point.price
+                num_levels += 1
+            pools[point.price] = [point]
 
         # Filter by touch threshold
         liquidity_pools = []
@@ -373,7 +374,15 @@ class ICTPatterns:
         events = []
         sorted_points = sorted(structure_points, key=lambda x: x.idx)
 
+        # Running minimum over lows seen before point i, same as min() over them
+        lowest_low: Optional[float] = None
+
         for i in range(1, len(sorted_points)):
+            if sorted_points[i - 1].point_type == "low" and (
+                lowest_low is None or sorted_points[i - 1].price < lowest_low
+            ):
+                lowest_low = sorted_points[i - 1].price
+
             prev_point = sorted_points[i - 1]
             curr_point = sorted_points[i]
 
@@ -409,8 +418,7 @@ class ICTPatterns:
                 and i > 1
             ):
                 # Check if this low is lower than previous low
-                prev_lows = [p for p in sorted_points[:i] if p.point_type == "low"]
-                if prev_lows and curr_point.price < min(p.price for p in prev_lows):
+                if lowest_low is not None and curr_point.price < lowest_low:
                     events.append(
                         {
                             "type": "CHoCH",
@@ -53,6 +53,10 @@ class PatternMatcher:
         Returns:
             List of pattern matches
         """
+        if current_data.empty or historical_data.empty:
+            logger.warning("Empty DataFrame provided for pattern matching")
+            return []
+
         if features is None:
             features = ["close"]
 
@@ -82,24 +86,32 @@ class PatternMatcher:
                 )
                 return []
 
-            # Normalize features
-            current_norm = self._normalize(current_features)
-            historical_norm = self._normalize(historical_features)
+            # Use most recent window from current data; stumpy only accepts
+            # float64, so integer price/volume columns are cast here
+            query = np.asarray(current_features[-self.window_size :], dtype=np.float64)
+            historical_features = np.asarray(historical_features, dtype=np.float64)
 
-            # Use most recent window from current data
-            query = current_norm[-self.window_size :]
+            # Compute distance profile; MASS z-normalizes the query once and
+            # every historical window via sliding mean/std, so a global
+            # normalization pass beforehand would be redundant
+            distance_profile = stumpy.mass(query, historical_features)
 
-            # Compute distance profile
-            distance_profile = stumpy.mass(query, historical_norm)
+            # Prune candidates with no bars after the window before ranking,
+            # so the top k are drawn only from usable matches
+            distance_profile = np.array(distance_profile, dtype=np.float64)
+            distance_profile[len(historical_data) - self.window_size :] = np.inf
+            num_candidates = int(np.isfinite(distance_profile).sum())
+
+            k = min(top_k, num_candidates)
+            if k <= 0:
+                return []
 
-            # Get top k matches
-            top_indices = np.argsort(distance_profile)[:top_k]
+            # Get top k matches: O(N) partial selection, then sort only those k
+            top_indices = np.argpartition(distance_profile, k - 1)[:k]
+            top_indices = top_indices[np.argsort(distance_profile[top_indices])]
 
             matches = []
             for idx in top_indices:
-                if idx + self.window_size >= len(historical_data):
-                    continue
-
                 # Calculate forward returns with dynamic timeframe
                 forward_returns = self._calculate_forward_returns(
                     historical_data, idx + self.window_size, timeframe_minutes
@@ -135,6 +147,10 @@ class PatternMatcher:
         Returns:
             List of motif dictionaries
         """
+        if data.empty:
+            logger.warning("Empty DataFrame provided for motif discovery")
+            return []
+
         if features is None:
             features = ["close"]
 
@@ -159,14 +175,16 @@ class PatternMatcher:
             # Compute matrix profile
             mp = stumpy.stump(features_norm, m=self.window_size)
 
-            # Find motifs
-            motif_indices = stumpy.motifs(
-                features_norm, mp[:, 0], k=k, cutoff=np.inf
+            # Find motifs on the float64 profile column; stumpy pads unused
+            # match slots with -1
+            _, motif_indices = stumpy.motifs(
+                features_norm, mp.P_, max_motifs=k, cutoff=np.inf
             )
 
             motifs = []
             for i, indices in enumerate(motif_indices):
-                if indices is not None and len(indices) > 0:
+                indices = indices[indices >= 0]
+                if len(indices) > 0:
                     motifs.append(
                         {
                             "motif_id": i,
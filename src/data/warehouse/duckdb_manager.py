@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
 import pandas as pd
+import pyarrow as pa
 import duckdb
 from loguru import logger
 import threading
@@ -173,8 +174,15 @@ class DuckDBManager:
                 missing = [col for col in required_cols if col not in df.columns]
                 raise ValueError(f"Missing required columns: {missing}")
 
-            # Prepare DataFrame
-            df_insert = df.copy()
+            # Prepare DataFrame with only the columns ohlcv_raw knows about
+            optional_cols = [
+                "quote_volume",
+                "trades_count",
+                "taker_buy_volume",
+                "taker_buy_quote_volume",
+            ]
+            insert_cols = required_cols + [c for c in optional_cols if c in df.columns]
+            df_insert = df[insert_cols].copy()
             df_insert["timestamp"] = pd.to_datetime(df_insert["timestamp"])
 
             # Deduplicate DataFrame before insert
@@ -187,26 +195,35 @@ class DuckDBManager:
             if duplicates_removed > 0:
                 logger.info(f"Removed {duplicates_removed} duplicate rows from DataFrame")
 
+            # Hand DuckDB a columnar Arrow table; string columns are
+            # dictionary-encoded so they are not transcoded row by row
+            arrow_table = pa.Table.from_pandas(df_insert, preserve_index=False)
+            for name in ["exchange", "symbol", "timeframe"]:
+                idx = arrow_table.schema.get_field_index(name)
+                column = arrow_table.column(idx)
+                if not pa.types.is_dictionary(column.type):
+                    arrow_table = arrow_table.set_column(
+                        idx, name, column.dictionary_encode()
+                    )
+
+            column_list = ", ".join(insert_cols)
+            conflict_clause = "OR REPLACE" if replace_duplicates else "OR IGNORE"
+
             try:
                 # Begin transaction
                 conn.execute("BEGIN TRANSACTION")
 
-                if replace_duplicates:
-                    # Use INSERT OR REPLACE
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO ohlcv_raw
-                        SELECT * FROM df_insert
-                    """
-                    )
-                else:
-                    # Use INSERT OR IGNORE to skip duplicates
+                conn.register("tmp_ohlcv", arrow_table)
+                try:
+                    # INSERT OR REPLACE overwrites duplicates, OR IGNORE skips them
                     conn.execute(
-                        """
-                        INSERT OR IGNORE INTO ohlcv_raw
-                        SELECT * FROM df_insert
+                        f"""
+                        INSERT {conflict_clause} INTO ohlcv_raw ({column_list})
+                        SELECT {column_list} FROM tmp_ohlcv
                     """
                     )
+                finally:
+                    conn.unregister("tmp_ohlcv")
 
                 # Update metadata table
                 if not df_insert.empty:
@@ -239,7 +256,7 @@ class DuckDBManager:
         try:
             # Group by exchange, symbol, timeframe
             for (exchange, symbol, timeframe), group_df in df.groupby(
-                ["exchange", "symbol", "timeframe"]
+                ["exchange", "symbol", "timeframe"], observed=True
             ):
                 first_ts = group_df["timestamp"].min()
                 last_ts = group_df["timestamp"].max()
@@ -179,19 +179,20 @@ class ParquetManager:
             logger.warning(f"No Parquet files found for {symbol} {timeframe}")
             return pd.DataFrame()
 
-        # Read all files and concatenate
-        dfs = []
+        # Read all files as Arrow tables and convert to pandas once
+        tables = []
         for file_path in files:
             try:
-                df = pd.read_parquet(file_path)
-                dfs.append(df)
+                tables.append(pq.read_table(file_path))
             except Exception as e:
                 logger.error(f"Error reading {file_path}: {e}")
 
-        if not dfs:
+        if not tables:
             return pd.DataFrame()
 
-        result = pd.concat(dfs, ignore_index=True)
+        # Index columns differ between partitions, so align schemas on concat
+        table = pa.concat_tables(tables, promote_options="default")
+        result = table.to_pandas()
         result = result.sort_values("timestamp").reset_index(drop=True)
 
         logger.info(f"Read {len(result)} rows from {len(files)} files")
@@ -60,60 +60,67 @@ class MomentumStrategy(BaseStrategy):
         volatility = abs(df["close"].diff()).rolling(window=self.kama_period).sum()
         df["efficiency"] = change / volatility
 
-        for i in range(max(self.slow_ma, self.kama_period) + 1, len(df)):
-            current = df.iloc[i]
-            prev = df.iloc[i - 1]
+        start_idx = max(self.slow_ma, self.kama_period) + 1
+        timeframe = df.iloc[0].get("timeframe", "1h")
+
+        # itertuples avoids materializing a Series per row like df.iloc does
+        rows = df[
+            ["timestamp", "close", "fast_ema", "slow_ema", "kama", "atr", "efficiency"]
+        ].itertuples(index=False, name=None)
+
+        prev_fast = prev_slow = None
+        for i, (timestamp, close, fast_ema, slow_ema, kama, atr, efficiency) in enumerate(rows):
+            if i < start_idx:
+                prev_fast, prev_slow = fast_ema, slow_ema
+                continue
+
+            # prev_* hold the previous bar's EMAs; update them before any skip
+            crossed_up = prev_fast <= prev_slow and fast_ema > slow_ema
+            crossed_down = prev_fast >= prev_slow and fast_ema < slow_ema
+            prev_fast, prev_slow = fast_ema, slow_ema
 
-            if pd.isna(current["efficiency"]) or pd.isna(current["atr"]):
+            if pd.isna(efficiency) or pd.isna(atr):
                 continue
 
             # Skip low efficiency markets
-            if current["efficiency"] < self.min_efficiency:
+            if efficiency < self.min_efficiency:
                 continue
 
             # Bullish crossover
-            if (
-                prev["fast_ema"] <= prev["slow_ema"]
-                and current["fast_ema"] > current["slow_ema"]
-                and current["close"] > current["kama"]
-            ):
-                entry_price = current["close"]
-                stop_loss = entry_price - (current["atr"] * self.atr_multiple)
-                take_profit = entry_price + (current["atr"] * self.atr_multiple * 2)
+            if crossed_up and close > kama:
+                entry_price = close
+                stop_loss = entry_price - (atr * self.atr_multiple)
+                take_profit = entry_price + (atr * self.atr_multiple * 2)
 
                 signals.append(
                     Signal(
-                        timestamp=current["timestamp"],
+                        timestamp=timestamp,
                         signal_type=SignalType.LONG,
                         entry_price=entry_price,
                         stop_loss=stop_loss,
                         take_profit=take_profit,
-                        confidence=current["efficiency"],
-                        timeframe=df.iloc[0].get("timeframe", "1h"),
-                        reason=f"Bullish MA crossover, efficiency={current['efficiency']:.2f}",
+                        confidence=efficiency,
+                        timeframe=timeframe,
+                        reason=f"Bullish MA crossover, efficiency={efficiency:.2f}",
                     )
                 )
 
             # Bearish crossover
-            if (
-                prev["fast_ema"] >= prev["slow_ema"]
-                and current["fast_ema"] < current["slow_ema"]
-                and current["close"] < current["kama"]
-            ):
-                entry_price = current["close"]
-                stop_loss = entry_price + (current["atr"] * self.atr_multiple)
-                take_profit = entry_price - (current["atr"] * self.atr_multiple * 2)
+            if crossed_down and close < kama:
+                entry_price = close
+                stop_loss = entry_price + (atr * self.atr_multiple)
+                take_profit = entry_price - (atr * self.atr_multiple * 2)
 
                 signals.append(
                     Signal(
-                        timestamp=current["timestamp"],
+                        timestamp=timestamp,
                         signal_type=SignalType.SHORT,
                         entry_price=entry_price,
                         stop_loss=stop_loss,
                         take_profit=take_profit,
-                        confidence=current["efficiency"],
-                        timeframe=df.iloc[0].get("timeframe", "1h"),
-                        reason=f"Bearish MA crossover, efficiency={current['efficiency']:.2f}",
+                        confidence=efficiency,
+                        timeframe=timeframe,
+                        reason=f"Bearish MA crossover, efficiency={efficiency:.2f}",
                     )
                 )
 
@@ -1,12 +1,88 @@
 """VWAP Pullback scalping strategy."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import pandas as pd
 import numpy as np
 from loguru import logger
 
 from src.strategies.base import BaseStrategy, Signal, SignalType
 from src.analytics.indicators.technical import TechnicalIndicators
+import pandas_ta as ta_lib
+
+VOLUME_ZSCORE_WINDOW = 20
+
+
+def _scan_signals(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    vwap: np.ndarray,
+    ema_9: np.ndarray,
+    ema_slope: np.ndarray,
+    atr_14: np.ndarray,
+    volume_zscore: np.ndarray,
+    min_distance_pct: float,
+    max_distance_pct: float,
+    volume_threshold: float,
+    warmup: int = 50,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Find VWAP pullback setups on pre-extracted float arrays.
+
+    Operates purely on NumPy arrays so parameter sweeps can rerun it on the
+    same cached columns without any DataFrame work.
+
+    Args:
+        close: Close prices
+        high: High prices
+        low: Low prices
+        vwap: VWAP values
+        ema_9: Confirmation EMA values
+        ema_slope: Bar-to-bar change of the confirmation EMA
+        atr_14: ATR values
+        volume_zscore: Rolling volume z-score
+        min_distance_pct: Minimum distance from VWAP in percent
+        max_distance_pct: Maximum distance from VWAP in percent
+        volume_threshold: Minimum volume z-score
+        warmup: Number of leading bars to skip
+
+    Returns:
+        Tuple of (hit indices, long flag per hit, distance from VWAP in
+        percent per bar, confidence per bar)
+    """
+    # Long and short setups are mutually exclusive (close above vs below VWAP)
+    # Bullish: price touches VWAP from below with momentum
+    long_mask = (
+        (low <= vwap)
+        & (close > vwap)
+        & (ema_slope > 0)
+        & (volume_zscore > volume_threshold)
+    )
+    # Bearish: price touches VWAP from above with momentum
+    short_mask = (
+        (high >= vwap)
+        & (close < vwap)
+        & (ema_slope < 0)
+        & (volume_zscore > volume_threshold)
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Distance from VWAP must be within target range
+        distance_pct = np.abs(close - vwap) / vwap * 100
+        in_range = (distance_pct >= min_distance_pct) & (distance_pct <= max_distance_pct)
+
+        # Confidence based on volume and momentum, precomputed for every bar
+        volume_factor = np.where(volume_zscore > 0, np.minimum(1.0, volume_zscore / 3), 0.0)
+        # Normalize momentum by EMA value instead of close price
+        momentum_factor = np.where(
+            ema_9 > 0, np.minimum(1.0, np.abs(ema_slope) / (ema_9 * 0.01)), 0.0
+        )
+        confidence = 0.6 * volume_factor + 0.4 * momentum_factor
+
+    valid = (long_mask | short_mask) & in_range & ~np.isnan(atr_14)
+    valid[:warmup] = False
+    hits = np.flatnonzero(valid)
+
+    return hits, long_mask[hits], distance_pct, confidence
 
 
 class VWAPPullbackStrategy(BaseStrategy):
@@ -25,6 +101,17 @@ class VWAPPullbackStrategy(BaseStrategy):
         self.max_distance_pct = config.get("max_vwap_distance_percent", 0.5)
         self.stop_atr_multiple = config.get("stop_loss_atr_multiple", 1.5)
         self.tp_atr_multiple = config.get("take_profit_atr_multiple", 3.0)
+        self.min_confidence = config.get("min_confidence", 0.0)
+
+        # Configuration is immutable after construction, so validate it once here
+        if not self.validate_config():
+            raise ValueError(
+                f"Invalid {self.name} configuration: "
+                f"ema_period={self.ema_period}, "
+                f"volume_threshold={self.volume_threshold}, "
+                f"distance range={self.min_distance_pct}%-{self.max_distance_pct}%, "
+                f"min_confidence={self.min_confidence} (must be within 0-1)"
+            )
 
     def validate_config(self) -> bool:
         """Validate configuration."""
@@ -34,6 +121,7 @@ class VWAPPullbackStrategy(BaseStrategy):
                 self.volume_threshold > 0,
                 self.min_distance_pct >= 0,
                 self.max_distance_pct > self.min_distance_pct,
+                0 <= self.min_confidence <= 1,
             ]
         )
 
@@ -46,122 +134,93 @@ class VWAPPullbackStrategy(BaseStrategy):
         Returns:
             List of trading signals
         """
-        if not self.validate_config():
-            logger.error("Invalid configuration")
-            return []
-
         if len(df) < 50:
             logger.warning("Insufficient data for strategy")
             return []
 
-        signals = []
-
-        # Add required indicators (call once, extract multiple)
-        missing_indicators = []
+        # Compute only the missing indicators and attach them in one concat
+        # rather than inserting columns into the caller's frame one by one
+        missing = {}
         if "vwap" not in df.columns:
-            missing_indicators.append("vwap")
+            missing["vwap"] = ta_lib.vwap(df["high"], df["low"], df["close"], df["volume"])
+
         if "ema_9" not in df.columns:
-            missing_indicators.append("ema_9")
+            missing["ema_9"] = ta_lib.ema(df["close"], length=9)
+
         if "atr_14" not in df.columns:
-            missing_indicators.append("atr_14")
+            missing["atr_14"] = TechnicalIndicators.calculate_atr(
+                df["high"], df["low"], df["close"], period=14
+            )
 
-        if missing_indicators:
-            df_with_indicators = TechnicalIndicators.add_all_indicators(df)
-            for indicator in missing_indicators:
-                if indicator in df_with_indicators.columns:
-                    df[indicator] = df_with_indicators[indicator]
+        if missing:
+            df = pd.concat([df, pd.DataFrame(missing, index=df.index)], axis=1)
 
-        # Volume z-score
-        vol_mean = df["volume"].rolling(window=20).mean()
-        vol_std = df["volume"].rolling(window=20).std()
-        df["volume_zscore"] = (df["volume"] - vol_mean) / vol_std
+        # Volume z-score; pandas rolling mean/std run on O(1) running sums
+        vol_rolling = df["volume"].rolling(window=VOLUME_ZSCORE_WINDOW)
+        volume_zscore = (
+            (df["volume"] - vol_rolling.mean()) / vol_rolling.std()
+        ).to_numpy(dtype=np.float64)
+
+        # Extract remaining columns once as float arrays
+        timestamps = df["timestamp"].to_numpy()
+        close = df["close"].to_numpy(dtype=np.float64)
+        high = df["high"].to_numpy(dtype=np.float64)
+        low = df["low"].to_numpy(dtype=np.float64)
+        vwap = df["vwap"].to_numpy(dtype=np.float64)
+        ema_9 = df["ema_9"].to_numpy(dtype=np.float64)
+        atr_14 = df["atr_14"].to_numpy(dtype=np.float64)
 
         # EMA slope (momentum)
-        df["ema_slope"] = df["ema_9"].diff()
-
-        for i in range(50, len(df)):
-            current = df.iloc[i]
-            prev = df.iloc[i - 1]
-
-            if pd.isna(current["vwap"]) or pd.isna(current["atr_14"]):
-                continue
-
-            # Distance from VWAP
-            distance_pct = abs(current["close"] - current["vwap"]) / current["vwap"] * 100
-
-            # Skip if not within target range
-            if not (self.min_distance_pct <= distance_pct <= self.max_distance_pct):
-                continue
-
-            # Bullish signal: Price touches VWAP from below with momentum
-            if (
-                current["low"] <= current["vwap"]
-                and current["close"] > current["vwap"]
-                and current["ema_slope"] > 0
-                and current["volume_zscore"] > self.volume_threshold
-            ):
-                entry_price = current["close"]
-                stop_loss = entry_price - (current["atr_14"] * self.stop_atr_multiple)
-                take_profit = entry_price + (current["atr_14"] * self.tp_atr_multiple)
-
-                # Calculate confidence based on volume and momentum (normalized properly)
-                volume_factor = min(1.0, current["volume_zscore"] / 3) if current["volume_zscore"] > 0 else 0
-                # Normalize momentum by EMA value instead of close price
-                momentum_factor = min(1.0, abs(current["ema_slope"]) / (current["ema_9"] * 0.01)) if current["ema_9"] > 0 else 0
-                confidence = 0.6 * volume_factor + 0.4 * momentum_factor
-
-                signals.append(
-                    Signal(
-                        timestamp=current["timestamp"],
-                        signal_type=SignalType.LONG,
-                        entry_price=entry_price,
-                        stop_loss=stop_loss,
-                        take_profit=take_profit,
-                        confidence=confidence,
-                        timeframe=df.iloc[0].get("timeframe", "1m"),
-                        reason=f"VWAP pullback long: distance={distance_pct:.2f}%, vol_z={current['volume_zscore']:.2f}",
-                        metadata={
-                            "vwap": current["vwap"],
-                            "ema_9": current["ema_9"],
-                            "volume_zscore": current["volume_zscore"],
-                        },
-                    )
-                )
-
-            # Bearish signal: Price touches VWAP from above with momentum
-            if (
-                current["high"] >= current["vwap"]
-                and current["close"] < current["vwap"]
-                and current["ema_slope"] < 0
-                and current["volume_zscore"] > self.volume_threshold
-            ):
-                entry_price = current["close"]
-                stop_loss = entry_price + (current["atr_14"] * self.stop_atr_multiple)
-                take_profit = entry_price - (current["atr_14"] * self.tp_atr_multiple)
-
-                # Calculate confidence based on volume and momentum (normalized properly)
-                volume_factor = min(1.0, current["volume_zscore"] / 3) if current["volume_zscore"] > 0 else 0
-                # Normalize momentum by EMA value instead of close price
-                momentum_factor = min(1.0, abs(current["ema_slope"]) / (current["ema_9"] * 0.01)) if current["ema_9"] > 0 else 0
-                confidence = 0.6 * volume_factor + 0.4 * momentum_factor
-
-                signals.append(
-                    Signal(
-                        timestamp=current["timestamp"],
-                        signal_type=SignalType.SHORT,
-                        entry_price=entry_price,
-                        stop_loss=stop_loss,
-                        take_profit=take_profit,
-                        confidence=confidence,
-                        timeframe=df.iloc[0].get("timeframe", "1m"),
-                        reason=f"VWAP pullback short: distance={distance_pct:.2f}%, vol_z={current['volume_zscore']:.2f}",
-                        metadata={
-                            "vwap": current["vwap"],
-                            "ema_9": current["ema_9"],
-                            "volume_zscore": current["volume_zscore"],
-                        },
-                    )
-                )
+        ema_slope = np.concatenate([[np.nan], ema_9[1:] - ema_9[:-1]])
+        timeframe = df.iloc[0].get("timeframe", "1m")
+
+        hits, is_long, distance_pct, confidence = _scan_signals(
+            close=close,
+            high=high,
+            low=low,
+            vwap=vwap,
+            ema_9=ema_9,
+            ema_slope=ema_slope,
+            atr_14=atr_14,
+            volume_zscore=volume_zscore,
+            min_distance_pct=self.min_distance_pct,
+            max_distance_pct=self.max_distance_pct,
+            volume_threshold=self.volume_threshold,
+        )
+
+        # Drop low-confidence setups on the arrays, before any Signal objects
+        # or reason strings are built for them
+        if self.min_confidence > 0:
+            keep = confidence[hits] >= self.min_confidence
+            hits, is_long = hits[keep], is_long[keep]
+
+        sign = np.where(is_long, 1.0, -1.0)
+        entries = close[hits]
+        stops = entries - sign * (atr_14[hits] * self.stop_atr_multiple)
+        take_profits = entries + sign * (atr_14[hits] * self.tp_atr_multiple)
+
+        # One Signal per hit rather than per bar
+        signals = [
+            Signal(
+                timestamp=pd.Timestamp(timestamps[k]),
+                signal_type=SignalType.LONG if is_long[j] else SignalType.SHORT,
+                entry_price=float(entries[j]),
+                stop_loss=float(stops[j]),
+                take_profit=float(take_profits[j]),
+                confidence=float(confidence[k]),
+                timeframe=timeframe,
+                reason=(
+                    f"VWAP pullback {'long' if is_long[j] else 'short'}: "
+                    f"distance={distance_pct[k]:.2f}%, vol_z={volume_zscore[k]:.2f}"
+                ),
+                metadata={
+                    "vwap": float(vwap[k]),
+                    "ema_9": float(ema_9[k]),
+                    "volume_zscore": float(volume_zscore[k]),
+                },
+            )
+            for j, k in enumerate(hits)
+        ]
 
         self.signals = signals
 
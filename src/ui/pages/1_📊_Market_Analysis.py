@@ -2,6 +2,7 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from pathlib import Path
 import sys
 
@@ -14,6 +15,10 @@ import plotly.graph_objects as go
 
 st.set_page_config(page_title="Market Analysis", page_icon="📊", layout="wide")
 
+# Maximum number of bars sent to the chart before decimating
+MAX_PLOT_POINTS = 10_000
+PLOT_RESAMPLE_FREQUENCIES = ["5min", "15min", "1h", "4h", "1D"]
+
 st.title("📊 Market Analysis")
 st.markdown("Analyze cryptocurrency markets with technical indicators and ICT patterns.")
 
@@ -35,17 +40,43 @@ days_back = st.sidebar.slider("Days to load", 1, 365, 30)
 # Load data
 @st.cache_data(ttl=300)
 def load_data(exchange, symbol, timeframe, days_back):
-    """Load data from DuckDB."""
+    """Load data from DuckDB.
+
+    Results are cached, so the connection is only opened on a cache miss
+    and closed straight away; holding it open would lock the database
+    file against the collector and validator processes.
+    """
+    db = DuckDBManager()
     try:
-        db = DuckDBManager()
         end_date = pd.Timestamp.now()
         start_date = end_date - pd.Timedelta(days=days_back)
-        df = db.query_ohlcv(symbol, timeframe, start_date, end_date, exchange)
-        db.close()
-        return df
+        return db.query_ohlcv(symbol, timeframe, start_date, end_date, exchange)
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return pd.DataFrame()
+    finally:
+        db.close()
+
+
+@st.cache_data(ttl=300)
+def calculate_indicators(cache_key, _df):
+    """Calculate indicators once per loaded dataset.
+
+    ``_df`` is excluded from Streamlit's argument hashing; ``cache_key``
+    identifies the dataset instead.
+    """
+    return TechnicalIndicators.add_all_indicators(_df)
+
+
+@st.cache_data(ttl=300)
+def detect_ict_patterns(cache_key, _df):
+    """Detect FVGs, order blocks and structure points once per dataset."""
+    return (
+        ICTPatterns.detect_fair_value_gaps(_df),
+        ICTPatterns.detect_order_blocks(_df),
+        ICTPatterns.detect_market_structure(_df),
+    )
+
 
 df = load_data(exchange, symbol, timeframe, days_back)
 
@@ -62,9 +93,22 @@ if df.empty:
     )
     st.stop()
 
+# Cache key changes only when the underlying data does, so widget
+# interactions that just change the view reuse the computed indicators
+data_key = (exchange, symbol, timeframe, days_back, len(df), df["timestamp"].iloc[-1])
+
 # Add indicators
 with st.spinner("Calculating indicators..."):
-    df = TechnicalIndicators.add_all_indicators(df)
+    df = calculate_indicators(data_key, df)
+
+# Locate the 24h lookback by timestamp so it holds for every timeframe
+timestamps = df["timestamp"].to_numpy(dtype="datetime64[ns]")
+closes = df["close"].to_numpy()
+cutoff_24h = timestamps[-1] - np.timedelta64(24, "h")
+# Change is measured from the bar at the cutoff itself; volume only counts bars
+# opened after it, so a full day of candles is summed without an extra bar
+start_24h = int(np.searchsorted(timestamps, cutoff_24h, side="left"))
+volume_start_24h = int(np.searchsorted(timestamps, cutoff_24h, side="right"))
 
 # Display metrics
 col1, col2, col3, col4 = st.columns(4)
@@ -74,11 +118,11 @@ with col1:
     st.metric("Last Price", f"${last_price:,.2f}")
 
 with col2:
-    change_24h = ((df.iloc[-1]["close"] - df.iloc[-24]["close"]) / df.iloc[-24]["close"] * 100) if len(df) >= 24 else 0
+    change_24h = (closes[-1] / closes[start_24h] - 1) * 100
     st.metric("24h Change", f"{change_24h:.2f}%", delta=change_24h)
 
 with col3:
-    volume_24h = df.iloc[-24:]["volume"].sum() if len(df) >= 24 else df["volume"].sum()
+    volume_24h = df["volume"].to_numpy()[volume_start_24h:].sum()
     st.metric("24h Volume", f"{volume_24h:,.0f}")
 
 with col4:
@@ -94,25 +138,47 @@ chart_type = st.radio(
     horizontal=True,
 )
 
-# Create Plotly chart
-fig = go.Figure()
+# Decimate long histories before handing them to Plotly
+plot_df = df
+if len(df) > MAX_PLOT_POINTS:
+    if chart_type == "Line":
+        plot_df = df.iloc[:: -(-len(df) // MAX_PLOT_POINTS)]
+    else:
+        # Resample to the finest coarser candle that fits the point budget
+        span = df["timestamp"].iloc[-1] - df["timestamp"].iloc[0]
+        plot_freq = next(
+            (f for f in PLOT_RESAMPLE_FREQUENCIES if span / pd.Timedelta(f) <= MAX_PLOT_POINTS),
+            PLOT_RESAMPLE_FREQUENCIES[-1],
+        )
+        agg = {col: "last" for col in df.columns if col != "timestamp"}
+        agg.update({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+        plot_df = (
+            df.set_index("timestamp")
+            .resample(plot_freq)
+            .agg(agg)
+            .dropna(subset=["close"])
+            .reset_index()
+        )
+
+# Collect traces and add them to the figure in one call
+traces = []
 
 if chart_type == "Candlestick":
-    fig.add_trace(
+    traces.append(
         go.Candlestick(
-            x=df["timestamp"],
-            open=df["open"],
-            high=df["high"],
-            low=df["low"],
-            close=df["close"],
+            x=plot_df["timestamp"],
+            open=plot_df["open"],
+            high=plot_df["high"],
+            low=plot_df["low"],
+            close=plot_df["close"],
             name="OHLC",
         )
     )
 else:
-    fig.add_trace(
+    traces.append(
         go.Scatter(
-            x=df["timestamp"],
-            y=df["close"],
+            x=plot_df["timestamp"],
+            y=plot_df["close"],
             mode="lines",
             name="Close",
             line=dict(color="#2962FF", width=2),
@@ -126,53 +192,53 @@ show_indicators = st.sidebar.multiselect(
     default=["SMA 20", "EMA 9", "VWAP"],
 )
 
-if "SMA 20" in show_indicators and "sma_20" in df.columns:
-    fig.add_trace(
+if "SMA 20" in show_indicators and "sma_20" in plot_df.columns:
+    traces.append(
         go.Scatter(
-            x=df["timestamp"],
-            y=df["sma_20"],
+            x=plot_df["timestamp"],
+            y=plot_df["sma_20"],
             mode="lines",
             name="SMA 20",
             line=dict(color="#FF6D00", width=1),
         )
     )
 
-if "EMA 9" in show_indicators and "ema_9" in df.columns:
-    fig.add_trace(
+if "EMA 9" in show_indicators and "ema_9" in plot_df.columns:
+    traces.append(
         go.Scatter(
-            x=df["timestamp"],
-            y=df["ema_9"],
+            x=plot_df["timestamp"],
+            y=plot_df["ema_9"],
             mode="lines",
             name="EMA 9",
             line=dict(color="#00E676", width=1),
         )
     )
 
-if "VWAP" in show_indicators and "vwap" in df.columns:
-    fig.add_trace(
+if "VWAP" in show_indicators and "vwap" in plot_df.columns:
+    traces.append(
         go.Scatter(
-            x=df["timestamp"],
-            y=df["vwap"],
+            x=plot_df["timestamp"],
+            y=plot_df["vwap"],
             mode="lines",
             name="VWAP",
             line=dict(color="#FFD600", width=1, dash="dash"),
         )
     )
 
-if "BB Bands" in show_indicators and "bb_upper" in df.columns:
-    fig.add_trace(
+if "BB Bands" in show_indicators and "bb_upper" in plot_df.columns:
+    traces.append(
         go.Scatter(
-            x=df["timestamp"],
-            y=df["bb_upper"],
+            x=plot_df["timestamp"],
+            y=plot_df["bb_upper"],
             mode="lines",
             name="BB Upper",
             line=dict(color="gray", width=1, dash="dot"),
         )
     )
-    fig.add_trace(
+    traces.append(
         go.Scatter(
-            x=df["timestamp"],
-            y=df["bb_lower"],
+            x=plot_df["timestamp"],
+            y=plot_df["bb_lower"],
             mode="lines",
             name="BB Lower",
             line=dict(color="gray", width=1, dash="dot"),
@@ -180,6 +246,9 @@ if "BB Bands" in show_indicators and "bb_upper" in df.columns:
         )
     )
 
+fig = go.Figure()
+fig.add_traces(traces)
+
 fig.update_layout(
     title=f"{symbol} {timeframe} Chart",
     xaxis_title="Time",
@@ -197,9 +266,7 @@ if st.sidebar.checkbox("Show ICT Patterns"):
     st.subheader("ICT Pattern Detection")
 
     with st.spinner("Detecting patterns..."):
-        fvgs = ICTPatterns.detect_fair_value_gaps(df)
-        order_blocks = ICTPatterns.detect_order_blocks(df)
-        structure_points = ICTPatterns.detect_market_structure(df)
+        fvgs, order_blocks, structure_points = detect_ict_patterns(data_key, df)
 
     col1, col2, col3 = st.columns(3)
 
@@ -1,5 +1,7 @@
 """Shared pytest fixtures for the crypto research platform."""
 
+import gc
+import os
 import tempfile
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -17,8 +19,7 @@ from pandas import DataFrame
 # ============================================================================
 
 
-@pytest.fixture
-def sample_ohlcv_data() -> DataFrame:
+def _generate_ohlcv_data() -> DataFrame:
     """Generate sample OHLCV data for testing.
 
     Returns:
@@ -49,6 +50,122 @@ def sample_ohlcv_data() -> DataFrame:
     return df
 
 
+# Bump the version whenever _generate_ohlcv_data changes
+SAMPLE_OHLCV_CACHE_FILE = "sample_ohlcv_v1.parquet"
+
+
+def _load_ohlcv_data(request: pytest.FixtureRequest) -> DataFrame:
+    """Load sample OHLCV data from the pytest cache, generating it on a miss."""
+    cache = getattr(request.config, "cache", None)
+    if cache is None:  # cacheprovider plugin disabled
+        return _generate_ohlcv_data()
+
+    path = Path(cache.mkdir("fixtures")) / SAMPLE_OHLCV_CACHE_FILE
+    if path.exists():
+        return pd.read_parquet(path)
+
+    df = _generate_ohlcv_data()
+
+    # Atomic write: xdist workers may race to fill the cache, so each writes
+    # its own temp file and renames it over the final path
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".parquet.tmp")
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    return df
+
+
+def _read_only(df: DataFrame) -> DataFrame:
+    """Rebuild a frame on read-only copies of its column arrays.
+
+    Extension-typed columns (categoricals, tz-aware timestamps) are copied
+    as-is so their dtype survives; only plain NumPy columns are locked.
+    """
+    columns = {}
+    for col in df.columns:
+        if isinstance(df[col].dtype, np.dtype):
+            values = df[col].to_numpy(copy=True)
+            values.setflags(write=False)
+        else:
+            values = df[col].array.copy()
+        columns[col] = values
+
+    return pd.DataFrame(columns, copy=False)
+
+
+@pytest.fixture(scope="session")
+def sample_ohlcv_data(request: pytest.FixtureRequest) -> DataFrame:
+    """Sample OHLCV data shared across the test session.
+
+    The generated frame is persisted to the pytest cache so repeated runs
+    skip regeneration. Column arrays are read-only so in-place writes fail
+    loudly instead of leaking into other tests. Tests that modify the frame
+    (including passing it to strategies, which add indicator columns) should
+    use ``sample_ohlcv_data_mut``.
+    """
+    return _read_only(_load_ohlcv_data(request))
+
+
+@pytest.fixture
+def sample_ohlcv_data_mut(sample_ohlcv_data: DataFrame) -> DataFrame:
+    """Writable per-test copy of ``sample_ohlcv_data``."""
+    return sample_ohlcv_data.copy()
+
+
+# Fixed UTC anchor so the warehouse fixture is deterministic across runs
+WAREHOUSE_TIMESTAMPS = pd.date_range(
+    start=pd.Timestamp("2024-01-01", tz="UTC"), periods=7 * 24, freq="1h"
+)
+
+
+def _generate_warehouse_ohlcv_data() -> DataFrame:
+    """Generate a week of hourly OHLCV rows in the warehouse schema.
+
+    Returns:
+        DataFrame with columns: exchange, symbol, timeframe, timestamp,
+        open, high, low, close, volume
+    """
+    timestamps = WAREHOUSE_TIMESTAMPS
+    n = len(timestamps)
+    i = np.arange(n, dtype=np.float64)
+
+    # Constant string columns as single-category categoricals
+    data = {
+        "exchange": pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), ["binance"]),
+        "symbol": pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), ["BTC/USDT"]),
+        "timeframe": pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), ["1h"]),
+        "timestamp": timestamps,
+        "open": 50000 + 10 * i,
+        "high": 50100 + 10 * i,
+        "low": 49900 + 10 * i,
+        "close": 50050 + 10 * i,
+        "volume": 100 + i,
+    }
+
+    return pd.DataFrame(data)
+
+
+@pytest.fixture(scope="session")
+def warehouse_ohlcv_data() -> DataFrame:
+    """Hourly OHLCV rows for DuckDB/Parquet tests, built once per session.
+
+    Column arrays are read-only; tests that hand the frame to code that
+    adds or replaces columns (e.g. ``ParquetManager.write_partition``)
+    should use ``warehouse_ohlcv_data_mut``.
+    """
+    return _read_only(_generate_warehouse_ohlcv_data())
+
+
+@pytest.fixture
+def warehouse_ohlcv_data_mut(warehouse_ohlcv_data: DataFrame) -> DataFrame:
+    """Writable per-test copy of ``warehouse_ohlcv_data``."""
+    return warehouse_ohlcv_data.copy()
+
+
 @pytest.fixture
 def sample_ohlcv_with_gaps() -> DataFrame:
     """Generate OHLCV data with intentional gaps for validation testing."""
@@ -174,6 +291,31 @@ def mock_async_exchange():
     return exchange
 
 
+@pytest.fixture(scope="session")
+def mock_ccxt_factory():
+    """Factory for async ccxt exchange mocks.
+
+    Returns:
+        Callable ``make_mock(ohlcv_side_effect=None)`` building a fresh
+        AsyncMock exchange; ``fetch_ohlcv`` returns sample candles unless
+        ``ohlcv_side_effect`` is given
+    """
+    candles = [
+        [1704067200000, 50000, 50500, 49500, 50200, 1000],
+        [1704067260000, 50200, 50600, 50000, 50400, 1100],
+    ]
+
+    def make_mock(ohlcv_side_effect=None):
+        exchange = AsyncMock()
+        exchange.fetch_ohlcv = AsyncMock(
+            return_value=candles, side_effect=ohlcv_side_effect
+        )
+        exchange.close = AsyncMock()
+        return exchange
+
+    return make_mock
+
+
 # ============================================================================
 # WebSocket Mock Fixtures
 # ============================================================================
@@ -276,9 +418,13 @@ def test_env_vars(monkeypatch):
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def strategy_config() -> Dict[str, Any]:
-    """Sample strategy configuration."""
+    """Sample strategy configuration.
+
+    Session-scoped so module-scoped fixtures can build on it; treat it as
+    read-only.
+    """
     return {
         "name": "test_strategy",
         "timeframe": "1h",
@@ -395,11 +541,18 @@ def sample_csv_data(tmp_path: Path) -> Path:
 # ============================================================================
 
 
+# Full collections are expensive; only force one every N tests
+GC_COLLECT_INTERVAL = 50
+_test_counter = 0
+
+
 @pytest.fixture(autouse=True)
 def cleanup_after_test():
-    """Cleanup resources after each test."""
+    """Periodically cleanup resources after tests."""
+    global _test_counter
+
     yield
     # Cleanup code runs after each test
-    import gc
-
-    gc.collect()
+    _test_counter += 1
+    if _test_counter % GC_COLLECT_INTERVAL == 0:
+        gc.collect()
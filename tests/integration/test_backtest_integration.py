@@ -3,23 +3,111 @@
 import pytest
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
+from typing import Any, Dict
 
 from src.backtesting.engine import BacktestEngine
+from src.strategies.quant.momentum import MomentumStrategy
+
+
+@dataclass(frozen=True)
+class EngineSnapshot:
+    """Outputs of a single backtest run."""
+
+    results: Dict[str, Any]
+    trades: pd.DataFrame
+    metrics: Dict[str, Any]
+    equity_curve: pd.DataFrame
+
+
+def run_engine_once(engine: BacktestEngine) -> EngineSnapshot:
+    """Run a backtest and call each result accessor exactly once.
+
+    Args:
+        engine: Configured backtest engine
+
+    Returns:
+        Frozen snapshot of the run's results, trades, metrics and equity curve
+    """
+    results = engine.run()
+    return EngineSnapshot(
+        results=results,
+        trades=engine.get_trades(),
+        metrics=engine.calculate_metrics(),
+        equity_curve=engine.get_equity_curve(),
+    )
+
+
+@pytest.fixture(scope="module")
+def momentum_backtest_result(sample_ohlcv_data, strategy_config):
+    """Run the default momentum backtest once per module.
+
+    Tests that only inspect different parts of the same run share this
+    instead of re-running the engine; configuration variants build their
+    own engines.
+    """
+    engine = BacktestEngine(
+        strategy=MomentumStrategy(config=strategy_config),
+        data=sample_ohlcv_data.copy(),
+        initial_capital=10000.0,
+    )
+    return run_engine_once(engine)
+
+
+def _check_performance_metrics(result):
+    """Verify all key performance metrics are present."""
+    required_metrics = [
+        "total_return",
+        "sharpe_ratio",
+        "sortino_ratio",
+        "max_drawdown",
+        "calmar_ratio",
+        "win_rate",
+        "profit_factor",
+        "expectancy",
+    ]
+
+    for metric in required_metrics:
+        assert metric in result.metrics
+
+
+def _check_trade_logging(result):
+    """Verify the trade log structure."""
+    trades = result.trades
+
+    if len(trades) > 0:
+        assert "entry_time" in trades.columns
+        assert "exit_time" in trades.columns
+        assert "entry_price" in trades.columns
+        assert "exit_price" in trades.columns
+        assert "pnl" in trades.columns
+        assert "return_pct" in trades.columns
+
+
+def _check_equity_curve(result):
+    """Verify the equity curve starts at the initial capital."""
+    equity_curve = result.equity_curve
+
+    assert isinstance(equity_curve, pd.DataFrame)
+    assert "equity" in equity_curve.columns
+    assert len(equity_curve) > 0
+    assert equity_curve["equity"].iloc[0] == 10000.0
 
 
 @pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.backtest
 class TestBacktestIntegration:
     """Test complete backtesting workflows."""
 
-    def test_full_backtest_with_slippage(self, sample_ohlcv_data, strategy_config):
+    def test_full_backtest_with_slippage(self, sample_ohlcv_data_mut, strategy_config):
         """Test backtest with realistic slippage modeling."""
-        from src.strategies.quant.momentum import MomentumStrategy
 
         strategy = MomentumStrategy(config=strategy_config)
 
         engine = BacktestEngine(
             strategy=strategy,
-            data=sample_ohlcv_data,
+            data=sample_ohlcv_data_mut,
             initial_capital=10000.0,
             commission=0.001,
             slippage=0.0005,
@@ -32,9 +120,8 @@ class TestBacktestIntegration:
             assert results["total_slippage"] > 0
             assert results["net_return"] < results["gross_return"]
 
-    def test_backtest_with_position_sizing(self, sample_ohlcv_data):
+    def test_backtest_with_position_sizing(self, sample_ohlcv_data_mut):
         """Test backtest with dynamic position sizing."""
-        from src.strategies.quant.momentum import MomentumStrategy
         from src.risk.position_sizer import ATRPositionSizer
 
         strategy = MomentumStrategy(
@@ -43,7 +130,7 @@ class TestBacktestIntegration:
 
         engine = BacktestEngine(
             strategy=strategy,
-            data=sample_ohlcv_data,
+            data=sample_ohlcv_data_mut,
             initial_capital=10000.0,
         )
 
@@ -53,95 +140,20 @@ class TestBacktestIntegration:
         assert "avg_position_size" in results
         assert results["avg_position_size"] > 0
 
-    def test_backtest_performance_metrics(self, sample_ohlcv_data, strategy_config):
-        """Test calculation of comprehensive performance metrics."""
-        from src.strategies.quant.momentum import MomentumStrategy
-
-        strategy = MomentumStrategy(config=strategy_config)
-
-        engine = BacktestEngine(
-            strategy=strategy,
-            data=sample_ohlcv_data,
-            initial_capital=10000.0,
-        )
-
-        results = engine.run()
-        metrics = engine.calculate_metrics()
-
-        # Verify all key metrics are present
-        required_metrics = [
-            "total_return",
-            "sharpe_ratio",
-            "sortino_ratio",
-            "max_drawdown",
-            "calmar_ratio",
-            "win_rate",
-            "profit_factor",
-            "expectancy",
-        ]
-
-        for metric in required_metrics:
-            assert metric in metrics
-
-    def test_backtest_trade_logging(self, sample_ohlcv_data, strategy_config):
-        """Test detailed trade logging."""
-        from src.strategies.quant.momentum import MomentumStrategy
-
-        strategy = MomentumStrategy(config=strategy_config)
+    @pytest.mark.parametrize(
+        "check",
+        [_check_performance_metrics, _check_trade_logging, _check_equity_curve],
+        ids=["performance_metrics", "trade_logging", "equity_curve"],
+    )
+    def test_backtest_aspect(self, momentum_backtest_result, check):
+        """Test one aspect of the shared momentum backtest run."""
+        check(momentum_backtest_result)
 
-        engine = BacktestEngine(
-            strategy=strategy,
-            data=sample_ohlcv_data,
-            initial_capital=10000.0,
-        )
-
-        results = engine.run()
-        trades = engine.get_trades()
-
-        if len(trades) > 0:
-            # Verify trade structure
-            assert "entry_time" in trades.columns
-            assert "exit_time" in trades.columns
-            assert "entry_price" in trades.columns
-            assert "exit_price" in trades.columns
-            assert "pnl" in trades.columns
-            assert "return_pct" in trades.columns
-
-    def test_backtest_equity_curve(self, sample_ohlcv_data, strategy_config):
-        """Test equity curve generation."""
-        from src.strategies.quant.momentum import MomentumStrategy
-
-        strategy = MomentumStrategy(config=strategy_config)
-
-        engine = BacktestEngine(
-            strategy=strategy,
-            data=sample_ohlcv_data,
-            initial_capital=10000.0,
-        )
-
-        results = engine.run()
-        equity_curve = engine.get_equity_curve()
-
-        assert isinstance(equity_curve, pd.DataFrame)
-        assert "equity" in equity_curve.columns
-        assert len(equity_curve) > 0
-        assert equity_curve["equity"].iloc[0] == 10000.0
-
-    def test_monte_carlo_simulation(self, sample_ohlcv_data, strategy_config):
+    def test_monte_carlo_simulation(self, momentum_backtest_result):
         """Test Monte Carlo simulation for backtest results."""
-        from src.strategies.quant.momentum import MomentumStrategy
         from src.backtesting.monte_carlo import MonteCarloSimulator
 
-        strategy = MomentumStrategy(config=strategy_config)
-
-        engine = BacktestEngine(
-            strategy=strategy,
-            data=sample_ohlcv_data,
-            initial_capital=10000.0,
-        )
-
-        results = engine.run()
-        trades = engine.get_trades()
+        trades = momentum_backtest_result.trades
 
         if len(trades) > 10:  # Need enough trades for MC
             simulator = MonteCarloSimulator(trades=trades)
@@ -154,10 +166,12 @@ class TestBacktestIntegration:
 
 
 @pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.backtest
 class TestBacktestRealism:
     """Test realistic backtesting scenarios."""
 
-    def test_market_hours_filter(self, sample_ohlcv_data):
+    def test_market_hours_filter(self, sample_ohlcv_data_mut):
         """Test trading only during specific market hours."""
         from src.strategies.scalping.session_range import SessionRangeStrategy
 
@@ -172,7 +186,7 @@ class TestBacktestRealism:
 
         engine = BacktestEngine(
             strategy=strategy,
-            data=sample_ohlcv_data,
+            data=sample_ohlcv_data_mut,
             initial_capital=10000.0,
         )
 
@@ -181,20 +195,19 @@ class TestBacktestRealism:
 
         # Verify trades only during specified hours
         if len(trades) > 0:
-            for _, trade in trades.iterrows():
-                hour = trade["entry_time"].hour
-                # Should be within London or NY hours
-                assert (8 <= hour < 16) or (13 <= hour < 20)
+            hours = pd.to_datetime(trades["entry_time"]).dt.hour.to_numpy()
+            # Should be within London or NY hours
+            in_session = ((hours >= 8) & (hours < 16)) | ((hours >= 13) & (hours < 20))
+            assert in_session.all()
 
-    def test_realistic_execution_delays(self, sample_ohlcv_data):
+    def test_realistic_execution_delays(self, sample_ohlcv_data_mut):
         """Test backtest with execution delays."""
-        from src.strategies.quant.momentum import MomentumStrategy
 
         strategy = MomentumStrategy(config={})
 
         engine = BacktestEngine(
             strategy=strategy,
-            data=sample_ohlcv_data,
+            data=sample_ohlcv_data_mut,
             initial_capital=10000.0,
             execution_delay_bars=1,  # 1 bar delay
         )
@@ -1,7 +1,7 @@
 """Integration tests for data pipeline components."""
 
 import pytest
-from datetime import datetime, timezone, timedelta
+from datetime import datetime
 import pandas as pd
 from pathlib import Path
 
@@ -21,34 +21,10 @@ def test_lake_path(tmp_path):
     return str(tmp_path / "lake")
 
 
-@pytest.fixture
-def sample_ohlcv_data():
-    """Generate sample OHLCV data for testing."""
-    timestamps = pd.date_range(
-        start=datetime.now(timezone.utc) - timedelta(days=7),
-        end=datetime.now(timezone.utc),
-        freq="1H"
-    )
-
-    data = {
-        "exchange": ["binance"] * len(timestamps),
-        "symbol": ["BTC/USDT"] * len(timestamps),
-        "timeframe": ["1h"] * len(timestamps),
-        "timestamp": timestamps,
-        "open": [50000 + i * 10 for i in range(len(timestamps))],
-        "high": [50100 + i * 10 for i in range(len(timestamps))],
-        "low": [49900 + i * 10 for i in range(len(timestamps))],
-        "close": [50050 + i * 10 for i in range(len(timestamps))],
-        "volume": [100 + i for i in range(len(timestamps))],
-    }
-
-    return pd.DataFrame(data)
-
-
 class TestDuckDBIntegration:
     """Integration tests for DuckDB operations."""
 
-    def test_full_pipeline(self, test_db_path, sample_ohlcv_data):
+    def test_full_pipeline(self, test_db_path, warehouse_ohlcv_data):
         """Test complete data pipeline: insert, query, validate."""
         db_manager = DuckDBManager(db_path=test_db_path)
 
@@ -57,8 +33,8 @@ class TestDuckDBIntegration:
             db_manager.init_schema()
 
             # Insert data
-            rows = db_manager.insert_ohlcv(sample_ohlcv_data)
-            assert rows == len(sample_ohlcv_data)
+            rows = db_manager.insert_ohlcv(warehouse_ohlcv_data)
+            assert rows == len(warehouse_ohlcv_data)
 
             # Query data back
             result = db_manager.query_ohlcv(
@@ -66,7 +42,7 @@ class TestDuckDBIntegration:
                 timeframe="1h",
                 exchange="binance"
             )
-            assert len(result) == len(sample_ohlcv_data)
+            assert len(result) == len(warehouse_ohlcv_data)
 
             # Validate data integrity
             validation = db_manager.validate_data_integrity(
@@ -122,13 +98,13 @@ class TestDuckDBIntegration:
 class TestParquetIntegration:
     """Integration tests for Parquet operations."""
 
-    def test_write_and_read_partition(self, test_lake_path, sample_ohlcv_data):
+    def test_write_and_read_partition(self, test_lake_path, warehouse_ohlcv_data_mut):
         """Test writing and reading Parquet partitions."""
         parquet_manager = ParquetManager(root_dir=test_lake_path)
 
         # Write partition
         parquet_manager.write_partition(
-            df=sample_ohlcv_data,
+            df=warehouse_ohlcv_data_mut,
             exchange="binance",
             symbol="BTC/USDT",
             timeframe="1h"
@@ -141,19 +117,19 @@ class TestParquetIntegration:
             timeframe="1h"
         )
 
-        assert len(result) == len(sample_ohlcv_data)
+        assert len(result) == len(warehouse_ohlcv_data_mut)
         assert list(result.columns) == [
             "exchange", "symbol", "timeframe", "timestamp",
             "open", "high", "low", "close", "volume"
         ]
 
-    def test_storage_stats(self, test_lake_path, sample_ohlcv_data):
+    def test_storage_stats(self, test_lake_path, warehouse_ohlcv_data_mut):
         """Test storage statistics calculation."""
         parquet_manager = ParquetManager(root_dir=test_lake_path)
 
         # Write some data
         parquet_manager.write_partition(
-            df=sample_ohlcv_data,
+            df=warehouse_ohlcv_data_mut,
             exchange="binance",
             symbol="BTC/USDT",
             timeframe="1h"
@@ -173,7 +149,7 @@ class TestEndToEnd:
     """End-to-end integration tests."""
 
     def test_duckdb_to_parquet_export(
-        self, test_db_path, test_lake_path, sample_ohlcv_data
+        self, test_db_path, test_lake_path, warehouse_ohlcv_data
     ):
         """Test exporting from DuckDB to Parquet."""
         db_manager = DuckDBManager(db_path=test_db_path)
@@ -182,7 +158,7 @@ class TestEndToEnd:
         try:
             # Initialize and insert into DuckDB
             db_manager.init_schema()
-            db_manager.insert_ohlcv(sample_ohlcv_data)
+            db_manager.insert_ohlcv(warehouse_ohlcv_data)
 
             # Export to Parquet
             db_manager.export_to_parquet(
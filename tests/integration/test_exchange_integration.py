@@ -1,8 +1,10 @@
 """Integration tests for exchange connectors."""
 
+import asyncio
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
+from src.data.connectors import binance as binance_module
 from src.data.connectors.binance import BinanceConnector
 from src.data.connectors.coinbase import CoinbaseConnector
 
@@ -56,9 +58,11 @@ class TestExchangeIntegration:
 
             await connector.disconnect()
 
-    async def test_rate_limiting(self, test_config, mock_ccxt_exchange):
+    async def test_rate_limiting(self, test_config, mock_ccxt_factory):
         """Test rate limiting across multiple requests."""
-        with patch("src.data.connectors.binance.ccxt.binance", return_value=mock_ccxt_exchange):
+        mock_exchange = mock_ccxt_factory()
+
+        with patch.object(binance_module.ccxt, "binance", return_value=mock_exchange):
             connector = BinanceConnector(
                 api_key=test_config["exchange"]["api_key"],
                 secret=test_config["exchange"]["secret"],
@@ -66,26 +70,25 @@ class TestExchangeIntegration:
 
             await connector.connect()
 
-            # Make multiple rapid requests
+            # Make multiple concurrent requests
             symbols = ["BTC/USDT", "ETH/USDT", "BNB/USDT"]
-            results = []
-
-            for symbol in symbols:
-                data = await connector.fetch_ohlcv(symbol, "1h", limit=10)
-                results.append(data)
+            results = await asyncio.gather(
+                *(connector.fetch_ohlcv(symbol, "1h", limit=10) for symbol in symbols)
+            )
 
             # Should complete without rate limit errors
             assert len(results) == 3
             assert all(len(r) > 0 for r in results)
+            requested = [c.kwargs["symbol"] for c in mock_exchange.fetch_ohlcv.call_args_list]
+            assert sorted(requested) == sorted(symbols)
 
             await connector.disconnect()
 
-    async def test_error_recovery(self, test_config):
+    async def test_error_recovery(self, test_config, mock_ccxt_factory):
         """Test connector error handling and recovery."""
-        mock_exchange = AsyncMock()
-        mock_exchange.fetch_ohlcv = AsyncMock(side_effect=Exception("Network error"))
+        mock_exchange = mock_ccxt_factory(ohlcv_side_effect=Exception("Network error"))
 
-        with patch("src.data.connectors.binance.ccxt.binance", return_value=mock_exchange):
+        with patch.object(binance_module.ccxt, "binance", return_value=mock_exchange):
             connector = BinanceConnector(
                 api_key=test_config["exchange"]["api_key"],
                 secret=test_config["exchange"]["secret"],
@@ -100,6 +103,7 @@ class TestExchangeIntegration:
 
 
 @pytest.mark.integration
+@pytest.mark.slow
 class TestMultiExchangeAggregation:
     """Test aggregating data from multiple exchanges."""
 
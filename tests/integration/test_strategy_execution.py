@@ -2,18 +2,37 @@
 
 import pytest
 import pandas as pd
+import numpy as np
+from types import SimpleNamespace
 
 from src.strategies.base import BaseStrategy
+from src.strategies.quant.momentum import MomentumStrategy
+from src.strategies.scalping.vwap_pullback import VWAPPullbackStrategy
 from src.backtesting.engine import BacktestEngine
 
 
+@pytest.fixture(scope="module")
+def multi_timeframe_ohlcv(sample_ohlcv_data):
+    """Sample 1m data with its 1h and 4h aggregations, built once per module.
+
+    The 4h bars are aggregated from the 1h bars rather than from 1m again.
+    """
+    from src.data.processors import TimeframeAggregator
+
+    aggregator = TimeframeAggregator()
+    m1 = sample_ohlcv_data.copy()
+    h1 = aggregator.aggregate(m1, "1m", "1h")
+    h4 = aggregator.aggregate(h1, "1h", "4h")
+
+    return SimpleNamespace(m1=m1, h1=h1, h4=h4)
+
+
 @pytest.mark.integration
 class TestStrategyExecution:
     """Test end-to-end strategy execution."""
 
-    def test_strategy_backtest_pipeline(self, sample_ohlcv_data, strategy_config):
+    def test_strategy_backtest_pipeline(self, sample_ohlcv_data_mut, strategy_config):
         """Test complete strategy backtest pipeline."""
-        from src.strategies.quant.momentum import MomentumStrategy
 
         # Initialize strategy
         strategy = MomentumStrategy(config=strategy_config)
@@ -21,7 +40,7 @@ class TestStrategyExecution:
         # Run backtest
         engine = BacktestEngine(
             strategy=strategy,
-            data=sample_ohlcv_data,
+            data=sample_ohlcv_data_mut,
             initial_capital=10000.0,
             commission=0.001,
         )
@@ -34,27 +53,22 @@ class TestStrategyExecution:
         assert "max_drawdown" in results
         assert results["total_trades"] >= 0
 
-    def test_strategy_signal_generation(self, sample_ohlcv_data, strategy_config):
+    def test_strategy_signal_generation(self, sample_ohlcv_data_mut, strategy_config):
         """Test strategy generates valid trading signals."""
-        from src.strategies.scalping.vwap_pullback import VWAPPullbackStrategy
 
         strategy = VWAPPullbackStrategy(config=strategy_config)
-        signals = strategy.generate_signals(sample_ohlcv_data)
+        signals = strategy.generate_signals(sample_ohlcv_data_mut)
 
         assert isinstance(signals, pd.DataFrame)
         assert "signal" in signals.columns
         assert signals["signal"].isin([-1, 0, 1]).all()
 
-    def test_multi_timeframe_strategy(self, sample_ohlcv_data):
+    def test_multi_timeframe_strategy(self, multi_timeframe_ohlcv):
         """Test strategy using multiple timeframes."""
         from src.strategies.ict.structure_trading import StructureTradingStrategy
-        from src.data.processors import TimeframeAggregator
-
-        aggregator = TimeframeAggregator()
 
-        # Create multi-timeframe data
-        data_1h = aggregator.aggregate(sample_ohlcv_data, "1m", "1h")
-        data_4h = aggregator.aggregate(sample_ohlcv_data, "1m", "4h")
+        data_1h = multi_timeframe_ohlcv.h1
+        data_4h = multi_timeframe_ohlcv.h4
 
         strategy = StructureTradingStrategy(
             config={
@@ -70,9 +84,8 @@ class TestStrategyExecution:
 
         assert isinstance(signals, pd.DataFrame)
 
-    def test_strategy_risk_management(self, sample_ohlcv_data, strategy_config):
+    def test_strategy_risk_management(self, sample_ohlcv_data_mut, strategy_config):
         """Test strategy risk management rules."""
-        from src.strategies.quant.momentum import MomentumStrategy
         from src.risk.position_sizer import PositionSizer
 
         strategy = MomentumStrategy(config=strategy_config)
@@ -82,8 +95,10 @@ class TestStrategyExecution:
         )
 
         # Generate signal
-        signals = strategy.generate_signals(sample_ohlcv_data)
-        signal_row = signals[signals["signal"] != 0].iloc[0]
+        signals = strategy.generate_signals(sample_ohlcv_data_mut)
+        # Locate the first non-zero signal without building a filtered frame
+        first_signal = np.flatnonzero(signals["signal"].to_numpy() != 0)[0]
+        signal_row = signals.iloc[first_signal]
 
         # Calculate position size
         position_size = sizer.calculate_size(
@@ -94,9 +109,8 @@ class TestStrategyExecution:
         assert position_size > 0
         assert position_size <= 10000.0  # Can't exceed account balance
 
-    def test_strategy_portfolio_integration(self, sample_ohlcv_data):
+    def test_strategy_portfolio_integration(self, sample_ohlcv_data_mut):
         """Test multiple strategies in a portfolio."""
-        from src.strategies.quant.momentum import MomentumStrategy
         from src.strategies.quant.mean_reversion import MeanReversionStrategy
         from src.portfolio.manager import PortfolioManager
 
@@ -112,7 +126,7 @@ class TestStrategyExecution:
         )
 
         # Run portfolio
-        results = portfolio.run_backtest(sample_ohlcv_data)
+        results = portfolio.run_backtest(sample_ohlcv_data_mut)
 
         assert "total_return" in results
         assert "strategy_allocations" in results
@@ -122,10 +136,9 @@ class TestStrategyExecution:
 class TestStrategyOptimization:
     """Test strategy parameter optimization."""
 
-    def test_parameter_grid_search(self, sample_ohlcv_data):
+    def test_parameter_grid_search(self, sample_ohlcv_data_mut):
         """Test grid search parameter optimization."""
         from src.backtesting.optimizer import GridSearchOptimizer
-        from src.strategies.quant.momentum import MomentumStrategy
 
         optimizer = GridSearchOptimizer(
             strategy_class=MomentumStrategy,
@@ -136,7 +149,7 @@ class TestStrategyOptimization:
         )
 
         best_params = optimizer.optimize(
-            data=sample_ohlcv_data,
+            data=sample_ohlcv_data_mut,
             objective="sharpe_ratio",
         )
 
@@ -144,10 +157,11 @@ class TestStrategyOptimization:
         assert "slow_ma" in best_params
         assert best_params["fast_ma"] < best_params["slow_ma"]
 
-    def test_walk_forward_analysis(self, sample_ohlcv_data):
+    @pytest.mark.slow
+    @pytest.mark.backtest
+    def test_walk_forward_analysis(self, sample_ohlcv_data_mut):
         """Test walk-forward optimization."""
         from src.backtesting.walk_forward import WalkForwardAnalyzer
-        from src.strategies.quant.momentum import MomentumStrategy
 
         analyzer = WalkForwardAnalyzer(
             strategy_class=MomentumStrategy,
@@ -155,7 +169,7 @@ class TestStrategyOptimization:
             num_periods=3,
         )
 
-        results = analyzer.analyze(sample_ohlcv_data)
+        results = analyzer.analyze(sample_ohlcv_data_mut)
 
         assert "in_sample_results" in results
         assert "out_of_sample_results" in results
@@ -9,8 +9,8 @@ from src.analytics.indicators.technical import TechnicalIndicators
 def test_kama_calculation():
     """Test KAMA calculation."""
     # Create sample data
-    np.random.seed(42)
-    close = pd.Series(np.cumsum(np.random.randn(100)) + 100)
+    rng = np.random.default_rng(42)
+    close = pd.Series(np.cumsum(rng.standard_normal(100)) + 100)
 
     kama = TechnicalIndicators.calculate_kama(close, period=10)
 
@@ -32,3 +32,31 @@ def test_atr_percent():
     )
 
     assert len(atr_pct) == len(df)
+
+
+def test_atr_wilder_smoothing():
+    """Test vectorized ATR matches a manual true-range/Wilder calculation."""
+    df = pd.DataFrame(
+        {
+            "high": [102.0, 103.0, 104.0, 103.0, 105.0, 106.0],
+            "low": [98.0, 99.0, 100.0, 99.0, 101.0, 102.0],
+            "close": [100.0, 101.0, 102.0, 101.0, 103.0, 104.0],
+        }
+    )
+
+    atr = TechnicalIndicators.calculate_atr(df["high"], df["low"], df["close"], period=3)
+
+    prev_close = df["close"].shift(1).fillna(df["close"].iloc[0])
+    tr = pd.concat(
+        [
+            df["high"] - df["low"],
+            (df["high"] - prev_close).abs(),
+            (df["low"] - prev_close).abs(),
+        ],
+        axis=1,
+    ).max(axis=1)
+    expected = tr.ewm(alpha=1 / 3, adjust=False, min_periods=3).mean()
+
+    assert len(atr) == len(df)
+    assert atr.iloc[:2].isna().all()
+    np.testing.assert_allclose(atr.iloc[2:], expected.iloc[2:])
@@ -12,16 +12,18 @@ def test_simple_backtest():
     """Test basic backtest execution."""
     # Create sample OHLCV data
     dates = pd.date_range(start="2024-01-01", periods=100, freq="1h")
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
+    # One draw for all four price walks
+    walks = np.cumsum(rng.standard_normal((4, 100)), axis=1)
 
     df = pd.DataFrame(
         {
             "timestamp": dates,
-            "open": 100 + np.cumsum(np.random.randn(100)),
-            "high": 102 + np.cumsum(np.random.randn(100)),
-            "low": 98 + np.cumsum(np.random.randn(100)),
-            "close": 100 + np.cumsum(np.random.randn(100)),
-            "volume": np.random.uniform(1000, 10000, 100),
+            "open": 100 + walks[0],
+            "high": 102 + walks[1],
+            "low": 98 + walks[2],
+            "close": 100 + walks[3],
+            "volume": rng.uniform(1000, 10000, 100),
         }
     )
 
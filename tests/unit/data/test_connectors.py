@@ -3,16 +3,22 @@
 import pytest
 from src.data.connectors.base import ExchangeConnector
 
+TIMEFRAME_SECONDS = [
+    ("1m", 60),
+    ("5m", 300),
+    ("1h", 3600),
+    ("1d", 86400),
+    ("1w", 604800),
+]
 
-def test_timeframe_to_seconds():
+
+@pytest.mark.parametrize("timeframe,expected_seconds", TIMEFRAME_SECONDS)
+def test_timeframe_to_seconds(timeframe, expected_seconds):
     """Test timeframe conversion."""
-    assert ExchangeConnector.timeframe_to_seconds("1m") == 60
-    assert ExchangeConnector.timeframe_to_seconds("1h") == 3600
-    assert ExchangeConnector.timeframe_to_seconds("1d") == 86400
-    assert ExchangeConnector.timeframe_to_seconds("1w") == 604800
+    assert ExchangeConnector.timeframe_to_seconds(timeframe) == expected_seconds
 
 
-def test_timeframe_to_milliseconds():
+@pytest.mark.parametrize("timeframe,expected_seconds", TIMEFRAME_SECONDS)
+def test_timeframe_to_milliseconds(timeframe, expected_seconds):
     """Test timeframe conversion to milliseconds."""
-    assert ExchangeConnector.timeframe_to_milliseconds("1m") == 60000
-    assert ExchangeConnector.timeframe_to_milliseconds("1h") == 3600000
+    assert ExchangeConnector.timeframe_to_milliseconds(timeframe) == expected_seconds * 1000
@@ -51,6 +51,35 @@ class TestPatternMatcher:
         # Should return empty list, not crash
         assert matches == []
 
+    def test_find_similar_patterns_integer_prices(self):
+        """Test integer price columns are matched like float ones."""
+        matcher = PatternMatcher(window_size=20)
+        rng = np.random.default_rng(7)
+        df = pd.DataFrame({
+            'close': (50000 + np.cumsum(rng.integers(-50, 51, 300))).astype(np.int64),
+        })
+
+        matches = matcher.find_similar_patterns(
+            current_data=df.iloc[-40:],
+            historical_data=df,
+            top_k=3,
+        )
+
+        assert len(matches) == 3
+
+    def test_find_motifs(self, sample_ohlcv_data):
+        """Test motif discovery returns valid occurrence offsets."""
+        matcher = PatternMatcher(window_size=20)
+
+        motifs = matcher.find_motifs(sample_ohlcv_data, k=2)
+
+        assert 0 < len(motifs) <= 2
+        for motif in motifs:
+            assert motif["count"] == len(motif["occurrences"])
+            assert all(
+                0 <= idx <= len(sample_ohlcv_data) - 20 for idx in motif["occurrences"]
+            )
+
 
 class TestICTPatterns:
     """Test ICT pattern detection."""
@@ -65,6 +94,15 @@ class TestICTPatterns:
         # Should return a list of structure points
         assert isinstance(structure, list)
 
+    def test_market_structure_invalid_lookback(self, sample_ohlcv_data):
+        """Test a zero swing lookback is rejected without raising."""
+        structure = ICTPatterns.detect_market_structure(
+            df=sample_ohlcv_data,
+            swing_lookback=0
+        )
+
+        assert structure == []
+
     def test_fair_value_gap_detection(self, sample_ohlcv_data):
         """Test Fair Value Gap detection."""
         fvgs = ICTPatterns.detect_fair_value_gaps(
@@ -128,12 +166,13 @@ class TestPatternValidation:
         required_cols = ['open', 'high', 'low', 'close', 'volume', 'timestamp']
         assert all(col in valid_df.columns for col in required_cols)
 
-        # Check OHLC relationships
-        assert all(valid_df['high'] >= valid_df['low'])
-        assert all(valid_df['high'] >= valid_df['open'])
-        assert all(valid_df['high'] >= valid_df['close'])
-        assert all(valid_df['low'] <= valid_df['open'])
-        assert all(valid_df['low'] <= valid_df['close'])
+        # Check OHLC relationships: high and low bound open, close and each other
+        opens, highs, lows, closes = valid_df[['open', 'high', 'low', 'close']].to_numpy().T
+        assert np.all(
+            (highs >= np.maximum(opens, closes))
+            & (lows <= np.minimum(opens, closes))
+            & (highs >= lows)
+        )
 
     def test_invalid_ohlc_relationships(self):
         """Test detection of invalid OHLC data."""
@@ -0,0 +1,36 @@
+"""Tests for VWAP pullback strategy."""
+
+import pytest
+
+from src.strategies.scalping.vwap_pullback import VWAPPullbackStrategy
+
+
+def test_invalid_config_rejected_at_init():
+    """Test invalid configuration raises on construction."""
+    with pytest.raises(ValueError):
+        VWAPPullbackStrategy(
+            {"min_vwap_distance_percent": 0.5, "max_vwap_distance_percent": 0.1}
+        )
+
+
+def test_valid_config():
+    """Test default configuration is accepted."""
+    strategy = VWAPPullbackStrategy({})
+    assert strategy.validate_config()
+
+
+def test_min_confidence_filters_signals(sample_ohlcv_data_mut):
+    """Test signals below the confidence threshold are dropped."""
+    all_signals = VWAPPullbackStrategy({}).generate_signals(sample_ohlcv_data_mut)
+    filtered = VWAPPullbackStrategy({"min_confidence": 0.5}).generate_signals(
+        sample_ohlcv_data_mut
+    )
+
+    assert len(filtered) <= len(all_signals)
+    assert all(s.confidence >= 0.5 for s in filtered)
+
+
+def test_invalid_min_confidence_rejected():
+    """Test out-of-range confidence threshold raises on construction."""
+    with pytest.raises(ValueError, match="min_confidence=1.5"):
+        VWAPPullbackStrategy({"min_confidence": 1.5})